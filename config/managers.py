@@ -51,6 +51,9 @@ class TaskManager(ConfigurableManager):
     def add_task(self, task: Task):
         self.data['tasks'].append(task)
 
+    def get_task(self, name: str) -> Task:
+        return next((t for t in self.data['tasks'] if t.name == name), None)
+
     def link_tasks(self, main_task_name: str, call_task_name: str):
         main_task = next((t for t in self.data['tasks'] if t.name == main_task_name), None)
         call_task = next((t for t in self.data['tasks'] if t.name == call_task_name), None)
@@ -168,6 +171,22 @@ class PhysicianManager(ConfigurableManager):
     def get_unavailability_periods(self, name) -> List[Union[date, Tuple[date, date]]]:
         return self.unavailability_periods.get(name, [])
 
+    def get_unavailability_mask(self, name, base_ord: int) -> int:
+        """
+        Returns a bitmap of the physician's unavailable days, where bit i stands for the day
+        with ordinal base_ord + i. Days before base_ord are dropped.
+        """
+        mask = 0
+        for period in self.unavailability_periods.get(name, []):
+            if isinstance(period, date):
+                start = end = period.toordinal()
+            else:
+                start, end = period[0].toordinal(), period[1].toordinal()
+            start = max(start, base_ord)
+            if start <= end:
+                mask |= ((1 << (end - start + 1)) - 1) << (start - base_ord)
+        return mask
+
     def save_config(self, filename: str):
         data = {
             'physicians': [physician.to_dict() for physician in self.data['physicians']]
@@ -112,7 +112,7 @@ class Calendar:
         print("Non-weekend Holidays:", non_weekend_holidays)
         return non_weekend_holidays
 
-    def determine_periods(self) -> Dict[str, List[Dict[str, Any]]]:
+    def determine_periods(self) -> Dict[date, List[Dict[str, Any]]]:
         periods = defaultdict(list)
         current_date = self.start_date
         previous_call_period = []
@@ -131,10 +131,10 @@ class Calendar:
                     main_period.append(day)
                 else:
                     if main_period:
-                        periods[week_start.isoformat()].append({'type': 'MAIN', 'days': main_period})
+                        periods[week_start].append({'type': 'MAIN', 'days': main_period})
                         main_period = []
             if main_period:
-                periods[week_start.isoformat()].append({'type': 'MAIN', 'days': main_period})
+                periods[week_start].append({'type': 'MAIN', 'days': main_period})
 
             # Determine call periods (consecutive call days)
             call_period = previous_call_period
@@ -167,9 +167,9 @@ class Calendar:
             self._add_single_call_period(periods, week_start, call_period, added_call_periods)
 
     def _add_single_call_period(self, periods, week_start, call_period, added_call_periods):
-        call_period_start = call_period[0].isoformat()
+        call_period_start = call_period[0]
         if call_period_start not in added_call_periods:
-            periods[week_start.isoformat()].append({'type': 'CALL', 'days': call_period})
+            periods[week_start].append({'type': 'CALL', 'days': call_period})
             added_call_periods.add(call_period_start)
 
     def save_calendar(self, filename: str):
@@ -227,9 +227,8 @@ class Calendar:
                 return f"{dates[0].strftime('%b %d')} - {dates[-1].strftime('%b %d')}"
 
         for week_start, week_periods in sorted(periods.items()):
-            week_start_date = date.fromisoformat(week_start)
-            week_end_date = week_start_date + timedelta(days=6)
-            print(f"\nWeek: {week_start_date.strftime('%b %d')} - {week_end_date.strftime('%b %d')}:")
+            week_end = week_start + timedelta(days=6)
+            print(f"\nWeek: {week_start.strftime('%b %d')} - {week_end.strftime('%b %d')}:")
 
             for period in week_periods:
                 period_type = period['type']
@@ -1,13 +1,15 @@
 from datetime import date, timedelta
 from typing import Dict, List, Any, Tuple
-from collections import defaultdict
+from collections import defaultdict, Counter
+from operator import itemgetter
 import calendar
-from ics import Calendar as IcsCalendar, Event
 import json
 import logging
+import uuid
 from models.task import TaskType
 
 logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 # models/schedule.py
 
@@ -15,63 +17,62 @@ class TaskMatcher:
     def __init__(self, physician_manager, task_manager):
         self.physician_manager = physician_manager
         self.task_manager = task_manager
-        self.physician_task_counts = defaultdict(lambda: defaultdict(int))
-        self.physician_task_days = defaultdict(lambda: defaultdict(list))
-        self.physician_call_counts = defaultdict(lambda: defaultdict(int))
-        self.last_heavy_task = {}
+        self.physician_task_counts: Dict[str, Dict[Any, int]] = {}
+        self.physician_assigned_days: Dict[str, int] = {}
+        self.physician_call_counts: Dict[str, Dict[int, int]] = {}
+        self.last_heavy_task_end_ord: Dict[str, int] = {}
         self.revenue_distribution = defaultdict(float)
+        self.index_physicians()
 
-    def _is_physician_eligible(self, physician: str, task: Any, period: Dict[str, Any]) -> bool:
-        physician_obj = self.physician_manager.get_physician_by_name(physician)
-        logging.debug(f"Checking eligibility for physician {physician} for task {task.name}")
-
-        if task.name in physician_obj.restricted_tasks or task.name in physician_obj.exclusion_tasks:
-            logging.debug(f"Physician {physician} is restricted or excluded from task {task.name}")
+    def index_physicians(self):
+        """
+        Builds the name lookups used by the eligibility checks. Must be called again when physicians change.
+        """
+        physicians = self.physician_manager.data['physicians']
+        self._physician_by_name = {p.name: p for p in physicians}
+        for p in physicians:
+            self.physician_task_counts.setdefault(p.name, {})
+            self.physician_call_counts.setdefault(p.name, {})
+            self.physician_assigned_days.setdefault(p.name, 0)
+        self._excluded_tasks_by_name = {p.name: frozenset(p.restricted_tasks) | frozenset(p.exclusion_tasks)
+                                        for p in physicians}
+        self._preferred_tasks_by_name = {p.name: frozenset(p.preferred_tasks) for p in physicians}
+
+    def is_physician_eligible(self, physician_obj: Any, task: Any, period: Dict[str, Any]) -> bool:
+        physician = physician_obj.name
+        logger.debug("Checking eligibility for physician %s for task %s", physician, task.name)
+
+        if task.name in self._excluded_tasks_by_name[physician]:
+            logger.debug("Physician %s is restricted or excluded from task %s", physician, task.name)
             return False
 
-        if task.is_call_task and self.physician_call_counts[physician][period['month']] > 0:
-            logging.debug(f"Physician {physician} has already been assigned a call task in month {period['month']}")
+        if task.is_call_task and self.physician_call_counts[physician].get(period['month'], 0) > 0:
+            logger.debug("Physician %s has already been assigned a call task in month %s", physician, period['month'])
             return False
 
         if task.is_discontinuous and not physician_obj.discontinuity_preference:
-            logging.debug(f"Physician {physician} does not prefer discontinuous tasks")
+            logger.debug("Physician %s does not prefer discontinuous tasks", physician)
             return False
 
-        logging.debug(f"Physician {physician} is eligible for task {task.name}")
+        logger.debug("Physician %s is eligible for task %s", physician, task.name)
         return True
 
-    def _get_eligible_physicians(self, available_physicians: List[str], task: Any, period: Dict[str, Any]) -> List[str]:
-        return [
-            p for p in available_physicians
-            if self._is_physician_eligible(p, task, period)
-        ]
-    def _get_available_physicians(self, days: List[date]) -> List[str]:
-        available_physicians = [
-            physician.name
-            for physician in self.physician_manager.data['physicians']
-            if all(not self.physician_manager.is_unavailable(physician.name, day) for day in days)
-        ]
-        logging.debug(f"Available physicians for days {days}: {available_physicians}")
-        return available_physicians
-
-    def find_best_match(self, available_physicians: List[str], task: Any, period: Dict[str, Any], month: int) -> Tuple[str, float]:
-        logging.debug(f"Finding best match for task {task.name} in period {period} for month {month}")
-        eligible_physicians = self._get_eligible_physicians(available_physicians, task, period)
-
+    def find_best_match(self, eligible_physicians: List[str], task: Any, period: Dict[str, Any], month: int) -> Tuple[str, float]:
+        logger.debug("Finding best match for task %s in period %s for month %s", task.name, period, month)
         if not eligible_physicians:
-            logging.debug(f"No eligible physicians found for task {task.name}")
+            logger.debug("No eligible physicians found for task %s", task.name)
             return None, 0
 
-        scored_physicians = self._score_physicians(eligible_physicians, task, period, month)
+        scored_physicians = self.score_physicians(eligible_physicians, task, period, month)
         best_physician = max(scored_physicians, key=scored_physicians.get)
-        logging.debug(f"Best match for task {task.name} is physician {best_physician} with score {scored_physicians[best_physician]}")
+        logger.debug("Best match for task %s is physician %s with score %s", task.name, best_physician, scored_physicians[best_physician])
         return best_physician, scored_physicians[best_physician]
 
-    def _score_physicians(self, eligible_physicians: List[str], task: Any, period: Dict[str, Any], month: int) -> Dict[
+    def score_physicians(self, eligible_physicians: List[str], task: Any, period: Dict[str, Any], month: int) -> Dict[
         str, float]:
         scores = {}
         for physician in eligible_physicians:
-            physician_obj = self.physician_manager.get_physician_by_name(physician)
+            physician_obj = self._physician_by_name[physician]
             score = 0
             score += self._score_preference(physician_obj, task)
             score += self._score_fairness(physician, task)
@@ -91,22 +92,22 @@ class TaskMatcher:
         return 0
 
     def _score_preference(self, physician_obj: Any, task: Any) -> float:
-        return 10 if task.name in physician_obj.preferred_tasks else 0
+        return 10 if task.name in self._preferred_tasks_by_name[physician_obj.name] else 0
 
     def _score_fairness(self, physician: str, task: Any) -> float:
-        task_count = self.physician_task_counts[physician][task.name]
+        task_count = self.physician_task_counts[physician].get(task.name, 0)
         return 5 / (task_count + 1)
 
     def _score_call_distribution(self, physician: str, task: Any, month: int) -> float:
         if task.is_call_task:
-            call_count = self.physician_call_counts[physician][month]
+            call_count = self.physician_call_counts[physician].get(month, 0)
             return 5 / (call_count + 1)
         return 0
 
     def _score_heavy_task_avoidance(self, physician: str, task: Any, period: Dict[str, Any]) -> float:
         if task.is_heavy:
-            if physician not in self.last_heavy_task or \
-                    (period['days'][0] - self.last_heavy_task[physician]).days > 7:
+            if physician not in self.last_heavy_task_end_ord or \
+                    period['start_ord'] - self.last_heavy_task_end_ord[physician] > 7:
                 return 5
         return 0
 
@@ -116,8 +117,8 @@ class TaskMatcher:
         return 0
 
     def _score_desired_working_weeks(self, physician: str) -> float:
-        total_days = sum(len(days) for days in self.physician_task_days[physician].values())
-        physician_obj = self.physician_manager.get_physician_by_name(physician)
+        total_days = self.physician_assigned_days[physician]
+        physician_obj = self._physician_by_name[physician]
         if total_days / 7 < physician_obj.desired_working_weeks * 52:
             return 5
         return 0
@@ -131,17 +132,91 @@ class TaskMatcher:
         return 0
 
     def update_physician_stats(self, physician: str, task: Any, period: Dict[str, Any]):
-        self.physician_task_counts[physician][task] += 1
-        self.physician_task_days[physician][task].extend(period['days'])
+        task_counts = self.physician_task_counts[physician]
+        task_counts[task] = task_counts.get(task, 0) + 1
+        self.physician_assigned_days[physician] += len(period['days'])
 
         if task.is_call_task:
-            self.physician_call_counts[physician][period['days'][0].month] += 1
+            call_counts = self.physician_call_counts[physician]
+            month = period['days'][0].month
+            call_counts[month] = call_counts.get(month, 0) + 1
 
         if task.is_heavy:
-            self.last_heavy_task[physician] = period['days'][-1]
+            self.last_heavy_task_end_ord[physician] = period['end_ord']
 
         self.revenue_distribution[physician] += task.revenue
 
+class PhysicianSchedule:
+    """
+    Stores the assignments of a single physician as parallel lists.
+
+    Attributes:
+        tasks (list): The assigned Task objects.
+        day_masks (list): The bitmap of days covered by each assignment, relative to the calendar start.
+        start_ords (list): The ordinal of the first day of each assignment.
+        end_ords (list): The ordinal of the last day of each assignment.
+        scores (list): The allocation score of each assignment.
+    """
+    __slots__ = ('tasks', 'day_masks', 'start_ords', 'end_ords', 'scores')
+
+    def __init__(self):
+        self.tasks: List[Any] = []
+        self.day_masks: List[int] = []
+        self.start_ords: List[int] = []
+        self.end_ords: List[int] = []
+        self.scores: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def append(self, task: Any, period: Dict[str, Any], score: float):
+        self.tasks.append(task)
+        self.day_masks.append(period['mask'])
+        self.start_ords.append(period['start_ord'])
+        self.end_ords.append(period['end_ord'])
+        self.scores.append(score)
+
+    def view(self, base_ord: int) -> List[Dict[str, Any]]:
+        """
+        Returns the assignments in the dictionary form exposed by Schedule.get_schedule.
+        """
+        return [
+            {
+                'task': task,
+                'days': self._mask_days(day_mask, base_ord),
+                'start_date': date.fromordinal(start_ord),
+                'end_date': date.fromordinal(end_ord),
+                'score': score
+            }
+            for task, day_mask, start_ord, end_ord, score in
+            zip(self.tasks, self.day_masks, self.start_ords, self.end_ords, self.scores)
+        ]
+
+    def to_dict(self, base_ord: int) -> List[Dict[str, Any]]:
+        """
+        Returns the assignments in a JSON-serializable form, with task names and ISO dates.
+        """
+        return [
+            {
+                'task': task.name,
+                'days': [day.isoformat() for day in self._mask_days(day_mask, base_ord)],
+                'start_date': date.fromordinal(start_ord).isoformat(),
+                'end_date': date.fromordinal(end_ord).isoformat(),
+                'score': score
+            }
+            for task, day_mask, start_ord, end_ord, score in
+            zip(self.tasks, self.day_masks, self.start_ords, self.end_ords, self.scores)
+        ]
+
+    @staticmethod
+    def _mask_days(day_mask: int, base_ord: int) -> List[date]:
+        days = []
+        while day_mask:
+            lowest_bit = day_mask & -day_mask
+            days.append(date.fromordinal(base_ord + lowest_bit.bit_length() - 1))
+            day_mask ^= lowest_bit
+        return days
+
 class Schedule:
     def __init__(self, physician_manager, task_manager, calendar):
         self.physician_manager = physician_manager
@@ -149,84 +224,112 @@ class Schedule:
         self.calendar = calendar
         self.scheduling_period = None
         self.task_splits = {}
-        self.schedule = defaultdict(list)
+        self.schedule = defaultdict(PhysicianSchedule)
         self.task_matcher = TaskMatcher(physician_manager, task_manager)
         self.off_days = {}
-        self.assigned_calls = defaultdict(lambda: defaultdict(int))
-        logging.debug("Schedule initialized with physician_manager, task_manager, and calendar")
+        self.assigned_calls: Dict[str, Dict[int, int]] = {}
+        self._base_ord = calendar.start_date.toordinal()
+        self._unavailability_masks = []
+        self._available_by_mask = {}
+        self._phys_day_mask = defaultdict(int)
+        self._task_day_mask = defaultdict(int)
+        self._main_period_by_date = {}
+        self._call_period_by_date = {}
+        self._index_tasks()
+        logger.debug("Schedule initialized with physician_manager, task_manager, and calendar")
 
     def set_scheduling_period(self, start_date: date, end_date: date):
         self.scheduling_period = (start_date, end_date)
-        logging.debug(f"Scheduling period set to {self.scheduling_period}")
+        logger.debug("Scheduling period set to %s", self.scheduling_period)
 
     def set_task_splits(self, task_splits: Dict[str, Dict[str, str]]):
         self.task_splits = task_splits
-        logging.debug(f"Task splits set to {self.task_splits}")
+        logger.debug("Task splits set to %s", self.task_splits)
 
     def set_off_days(self, off_days: Dict[str, List[date]]):
         self.off_days = off_days
-        logging.debug(f"Off days set to {self.off_days}")
+        logger.debug("Off days set to %s", self.off_days)
 
     def generate_schedule(self):
         if not self.scheduling_period:
             raise ValueError("Scheduling period must be set before generating schedule")
-        logging.debug("Generating schedule")
+        logger.debug("Generating schedule")
+        self.task_matcher.index_physicians()
+        self._index_tasks()
+        self._build_unavailability_masks()
+        for physician in self.physician_manager.data['physicians']:
+            self.assigned_calls.setdefault(physician.name, {})
         extended_end_date = self._extend_scheduling_period()
-        logging.debug(f"Scheduling period extended to {extended_end_date}")
+        logger.debug("Scheduling period extended to %s", extended_end_date)
 
         periods = self.calendar.determine_periods()
+        self._prepare_periods(periods)
+        self._index_periods(periods)
         relevant_periods = self._filter_relevant_periods(periods, extended_end_date)
-        logging.debug(f"Filtered relevant periods: {relevant_periods}")
+        logger.debug("Filtered relevant periods: %s", relevant_periods)
 
         for week_start, week_periods in relevant_periods.items():
-            logging.debug(f"Assigning task for {week_periods}")
-            self._assign_tasks_for_period(date.fromisoformat(week_start), week_periods)
+            logger.debug("Assigning task for %s", week_periods)
+            self._assign_tasks_for_period(week_start, week_periods)
 
         self._handle_extended_tasks(extended_end_date)
 
-        logging.debug("Schedule generated")
+        logger.debug("Schedule generated")
+
+    def _index_tasks(self):
+        """
+        Caches the task sequences and linked call lookups walked for every week of the schedule.
+        """
+        tasks = self.task_manager.data['tasks']
+        linkage_manager = self.task_manager.data['linkage_manager']
+        tasks_by_name = {}
+        for task in tasks:
+            tasks_by_name.setdefault(task.name, task)
+        linked_call_names = set(linkage_manager.links.values())
+
+        self._all_tasks = tuple(tasks)
+        self._linked_call_by_task = {task.name: tasks_by_name.get(linkage_manager.get_linked_call(task))
+                                     for task in tasks if task.type == TaskType.MAIN}
+        self._unlinked_call_tasks = tuple(task for task in tasks
+                                          if task.type == TaskType.CALL and task.name not in linked_call_names)
 
     def _handle_extended_tasks(self, extended_end_date: date):
-        for task in self.task_manager.data['tasks']:
+        for task in self._all_tasks:
             if task.number_of_weeks > 1:
-                last_assigned = max(
-                    (t['end_date'] for t in self.schedule.values() for t in t if t['task'].name == task),
+                last_assigned_ord = max(
+                    (end_ord for assignments in self.schedule.values()
+                     for t, end_ord in zip(assignments.tasks, assignments.end_ords) if t.name == task),
                     default=None)
-                if last_assigned and last_assigned < extended_end_date:
-                    remaining_weeks = (extended_end_date - last_assigned).days // 7
+                if last_assigned_ord and last_assigned_ord < extended_end_date.toordinal():
+                    remaining_weeks = (extended_end_date.toordinal() - last_assigned_ord) // 7
                     for week in range(remaining_weeks):
-                        start_date = last_assigned + timedelta(weeks=week + 1)
-                        end_date = start_date + timedelta(days=6)
-                        period = {'days': [start_date + timedelta(days=i) for i in range(7)], 'month': start_date.month}
-                        available_physicians = self._get_available_physicians(period['days'])
-                        self._assign_main_task(start_date, period, available_physicians, task)
+                        start_date = date.fromordinal(last_assigned_ord + 7 * (week + 1))
+                        period = self._prepare_period(
+                            {'days': [start_date + timedelta(days=i) for i in range(7)], 'month': start_date.month})
+                        self._assign_main_task(start_date, period, task)
 
     def _extend_scheduling_period(self) -> date:
-        max_task_duration = max(task.number_of_weeks for task in self.task_manager.data['tasks'])
+        max_task_duration = max(task.number_of_weeks for task in self._all_tasks)
         extended_end_date = self.scheduling_period[1] + timedelta(weeks=max_task_duration)
         return extended_end_date
 
-    def _filter_relevant_periods(self, periods: Dict[str, List[Dict[str, Any]]], end_date: date) -> Dict[
-        str, List[Dict[str, Any]]]:
+    def _filter_relevant_periods(self, periods: Dict[date, List[Dict[str, Any]]], end_date: date) -> Dict[
+        date, List[Dict[str, Any]]]:
         return {
             week_start: week_periods
             for week_start, week_periods in periods.items()
-            if date.fromisoformat(week_start) <= end_date
+            if week_start <= end_date
         }
 
     def _assign_tasks_for_period(self, week_start: date, periods: List[Dict[str, Any]]):
-        for task in self.task_manager.data['tasks']:
+        for task in self._all_tasks:
             if task.type == TaskType.MAIN:
                 if main_period := self._get_main_candidate(periods):
-                    available_physicians = self._get_available_physicians(main_period['days'])
-                    assigned_physician = self._assign_main_task(week_start, main_period, available_physicians, task)
+                    assigned_physician = self._assign_main_task(week_start, main_period, task)
 
                     if assigned_physician:
                         # Assign linked call task immediately after main task
-                        linked_call_task_name = self.task_manager.data['linkage_manager'].get_linked_call(task)
-                        linked_call_task = next(
-                            (t for t in self.task_manager.data['tasks'] if t.name == linked_call_task_name), None)
-
+                        linked_call_task = self._linked_call_by_task.get(task.name)
                         if linked_call_task:
                             call_period = self._get_call_candidate(periods)
                             if call_period:
@@ -234,91 +337,122 @@ class Schedule:
                                                               linked_call_task)
 
         # Handle remaining unassigned call tasks
-        for task in self.task_manager.data['tasks']:
-            if task.type == TaskType.CALL and task.name not in self.task_manager.data['linkage_manager'].links.values():
-                if call_period := self._get_call_candidate(periods):
-                    available_physicians = self._get_available_physicians(call_period['days'])
-                    self._assign_call_task(week_start, call_period, available_physicians, task)
+        if self._unlinked_call_tasks:
+            if call_period := self._get_call_candidate(periods):
+                self._assign_call_tasks(week_start, call_period, self._unlinked_call_tasks)
 
-    def _assign_main_task(self, week_start: date, period: Dict[str, Any], available_physicians: List[str], task):
+    def _assign_main_task(self, week_start: date, period: Dict[str, Any], task):
         period['month'] = week_start.month
-        physician, score = self.task_matcher.find_best_match(available_physicians, task, period, week_start.month)
+        candidates = self._get_candidates(period, task)
+        physician, score = self.task_matcher.find_best_match(candidates, task, period, week_start.month)
         if physician:
             for week in range(task.number_of_weeks):
                 current_period = self._get_period_for_date(week_start + timedelta(weeks=week), 'MAIN')
                 if current_period is None:
-                    logging.debug(f"Only CALL periods found for {week_start + timedelta(weeks=week)}")
+                    logger.debug("Only CALL periods found for %s", week_start + timedelta(weeks=week))
                 else:
                     if not self._is_task_already_assigned(task, current_period) and not self._is_physician_already_assigned(physician, current_period):
                         self._add_to_schedule(physician, task, current_period, score)
                         self.task_matcher.update_physician_stats(physician, task, current_period)
                     else:
-                        logging.debug(f"Task {task.name} is already assigned during {current_period['days']} or physician {physician} is already assigned another task")
-            if physician in available_physicians:
-                available_physicians.remove(physician)
-            logging.debug(f"Assigned main task {task.name} to {physician} for {task.number_of_weeks} weeks")
+                        logger.debug("Task %s is already assigned during %s or physician %s is already assigned another task", task.name, current_period['days'], physician)
+            logger.debug("Assigned main task %s to %s for %s weeks", task.name, physician, task.number_of_weeks)
             return physician
         else:
-            logging.debug(f"No eligible physician found for main task {task.name}")
+            logger.debug("No eligible physician found for main task %s", task.name)
             return None
 
     def _assign_linked_call_task(self, week_start: date, period: Dict[str, Any], physician: str, task):
         if not self._is_task_already_assigned(task, period) and not self._is_physician_already_assigned(physician, period):
             if 'month' not in period:
                 period['month'] = period['days'][0].month
-            if self.assigned_calls[physician][period['month']] == 0:
+            calls = self.assigned_calls[physician]
+            if calls.get(period['month'], 0) == 0:
                 self._add_to_schedule(physician, task, period, 0)
                 self.task_matcher.update_physician_stats(physician, task, period)
-                self.assigned_calls[physician][period['month']] += 1
-                logging.debug(f"Assigned linked call task {task.name} to {physician}")
+                calls[period['month']] = calls.get(period['month'], 0) + 1
+                logger.debug("Assigned linked call task %s to %s", task.name, physician)
             else:
-                logging.debug(f"Unable to assign linked call task {task.name} to {physician} due to monthly call limit")
+                logger.debug("Unable to assign linked call task %s to %s due to monthly call limit", task.name, physician)
         else:
-            logging.debug(f"Unable to assign linked call task {task.name} to {physician} due to conflicts")
+            logger.debug("Unable to assign linked call task %s to %s due to conflicts", task.name, physician)
 
 
-    def _assign_call_task(self, week_start: date, period: Dict[str, Any], available_physicians: List[str], task):
+    def _assign_call_tasks(self, week_start: date, period: Dict[str, Any], tasks):
+        """
+        Assigns call tasks sharing a call period through a maximum bipartite matching between tasks and
+        physicians. Each task tries its candidates by decreasing score, so the best match is kept whenever
+        it does not leave another task without a physician.
+        """
         period['month'] = week_start.month
-        physician, score = self.task_matcher.find_best_match(available_physicians, task, period, week_start.month)
-        if physician:
-            if not self._is_task_already_assigned(task, period) and not self._is_physician_already_assigned(physician, period):
-                if self.assigned_calls[physician][period['month']] == 0:
-                    self._add_to_schedule(physician, task, period, score)
-                    available_physicians.remove(physician)
-                    self.task_matcher.update_physician_stats(physician, task, period)
-                    self.assigned_calls[physician][period['month']] += 1
-                    logging.debug(f"Assigned call task {task.name} to {physician}")
-                else:
-                    logging.debug(f"Unable to assign call task {task.name} to {physician} due to monthly call limit")
+        ranked_candidates = {}
+        scores = {}
+        for task in tasks:
+            if self._is_task_already_assigned(task, period):
+                logger.debug("Task %s is already assigned during %s", task.name, period['days'])
+                continue
+            candidates = self._get_candidates(period, task)
+            scores[task] = self.task_matcher.score_physicians(candidates, task, period, week_start.month)
+            ranked_candidates[task] = sorted(candidates, key=scores[task].get, reverse=True)
+
+        matches = {}
+        for task in ranked_candidates:
+            self._find_augmenting_path(task, ranked_candidates, matches, set())
+        assigned = {task: physician for physician, task in matches.items()}
+
+        for task in ranked_candidates:
+            physician = assigned.get(task)
+            if physician:
+                self._add_to_schedule(physician, task, period, scores[task][physician])
+                self.task_matcher.update_physician_stats(physician, task, period)
+                calls = self.assigned_calls[physician]
+                calls[period['month']] = calls.get(period['month'], 0) + 1
+                logger.debug("Assigned call task %s to %s", task.name, physician)
             else:
-                logging.debug(f"Task {task.name} is already assigned during {period['days']} or physician {physician} is already assigned another task")
-        else:
-            logging.debug(f"No eligible physician found for call task {task.name}")
-
-    def _is_physician_already_assigned(self, physician: str, period: Dict[str, Any]) -> bool:
-        for assigned_task in self.schedule[physician]:
-            if any(day in period['days'] for day in assigned_task['days']):
+                logger.debug("No eligible physician found for call task %s", task.name)
+
+    @staticmethod
+    def _find_augmenting_path(task, ranked_candidates, matches, visited) -> bool:
+        candidates = ranked_candidates[task]
+        for physician in candidates:
+            if physician not in matches:
+                matches[physician] = task
+                return True
+        for physician in candidates:
+            if physician in visited:
+                continue
+            visited.add(physician)
+            if Schedule._find_augmenting_path(matches[physician], ranked_candidates, matches, visited):
+                matches[physician] = task
                 return True
         return False
 
+    def _is_physician_already_assigned(self, physician: str, period: Dict[str, Any]) -> bool:
+        return bool(self._phys_day_mask[physician] & period['mask'])
+
     def _is_task_already_assigned(self, task: Any, period: Dict[str, Any]) -> bool:
-        for physician, tasks in self.schedule.items():
-            for assigned_task in tasks:
-                if assigned_task['task'].name == task.name and any(day in period['days'] for day in assigned_task['days']):
-                    return True
-        return False
+        return bool(self._task_day_mask[task.name] & period['mask'])
+
     def _get_period_for_date(self, date: date, type = str) -> Dict[str, Any]:
         """
-        Returns the period dictionary for a given date.
+        Returns the period dictionary for a given date, or None if that week has no such period.
         """
-        logging.debug(f"Getting period for date {date}")
-        try:
-            periods = self.calendar.determine_periods()
-            date_string = date.strftime('%Y-%m-%d')
-            candidates = periods[date_string]
-            return self._get_call_candidate(candidates) if type == 'CALL' else self._get_main_candidate(candidates)
-        except:
-            raise ValueError(f"No period found for date: {date}")
+        logger.debug("Getting period for date %s", date)
+        if type == 'CALL':
+            return self._call_period_by_date.get(date)
+        return self._main_period_by_date.get(date)
+
+    def _index_periods(self, periods: Dict[date, List[Dict[str, Any]]]):
+        """
+        Indexes the first MAIN and CALL period of each week by the week start date.
+        """
+        self._main_period_by_date = {}
+        self._call_period_by_date = {}
+        for week_start, candidates in periods.items():
+            if main_period := self._get_main_candidate(candidates):
+                self._main_period_by_date[week_start] = main_period
+            if call_period := self._get_call_candidate(candidates):
+                self._call_period_by_date[week_start] = call_period
 
     def _get_call_candidate(self, candidates):
         return next((candidate for candidate in candidates if candidate['type'] == 'CALL'), None)
@@ -326,78 +460,121 @@ class Schedule:
     def _get_main_candidate(self, candidates):
         return next((candidate for candidate in candidates if candidate['type'] == 'MAIN'), None)
 
-    def _get_available_physicians(self, days: List[date]) -> List[str]:
-        return [
-            physician.name
+    def _build_unavailability_masks(self):
+        """
+        Precomputes one unavailability bitmap per physician, relative to the calendar start.
+        """
+        self._unavailability_masks = [
+            (physician, self.physician_manager.get_unavailability_mask(physician.name, self._base_ord))
             for physician in self.physician_manager.data['physicians']
-            if all(not self.physician_manager.is_unavailable(physician.name, day) for day in days)
         ]
+        self._available_by_mask = {}
+
+    def _prepare_periods(self, periods: Dict[date, List[Dict[str, Any]]]):
+        for week_periods in periods.values():
+            for period in week_periods:
+                self._prepare_period(period)
+
+    def _prepare_period(self, period: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stores the period's day bitmap and first/last day ordinals on the period itself.
+        """
+        days = period['days']
+        period['mask'] = self._day_mask(days)
+        period['start_ord'] = days[0].toordinal()
+        period['end_ord'] = days[-1].toordinal()
+        return period
+
+    def _day_mask(self, days: List[date]) -> int:
+        mask = 0
+        for day in days:
+            mask |= 1 << (day.toordinal() - self._base_ord)
+        return mask
+
+    def _get_candidates(self, period: Dict[str, Any], task: Any) -> List[str]:
+        """
+        Returns the physicians available for every day of the period and eligible for the task, in one pass.
+        For call tasks, physicians already working during the period or at their monthly call limit are
+        skipped as well.
+        """
+        period_mask = period['mask']
+        available = self._available_by_mask.get(period_mask)
+        if available is None:
+            # Shared by every task scheduled over the same days
+            available = self._available_by_mask[period_mask] = [physician for physician, mask in self._unavailability_masks
+                                                                if not mask & period_mask]
+        is_eligible = self.task_matcher.is_physician_eligible
+        if task.is_call_task:
+            month = period['month']
+            busy_masks = self._phys_day_mask
+            assigned_calls = self.assigned_calls
+            return [physician.name for physician in available
+                    if not busy_masks[physician.name] & period_mask
+                    and not assigned_calls[physician.name].get(month)
+                    and is_eligible(physician, task, period)]
+        return [physician.name for physician in available if is_eligible(physician, task, period)]
 
     def _add_to_schedule(self, physician: str, task: Any, period: Dict[str, Any], score: float):
-        self.schedule[physician].append({
-            'task': task,
-            'days': period['days'],
-            'start_date': period['days'][0],
-            'end_date': period['days'][-1],
-            'score': score
-        })
+        self.schedule[physician].append(task, period, score)
+        self._phys_day_mask[physician] |= period['mask']
+        self._task_day_mask[task.name] |= period['mask']
+
     def get_schedule(self) -> Dict[str, List[Dict[str, Any]]]:
-        return dict(self.schedule)
+        return {physician: assignments.view(self._base_ord) for physician, assignments in self.schedule.items()}
 
     def print_schedule(self):
-        for physician, tasks in self.schedule.items():
+        for physician, assignments in self.schedule.items():
             print(f"\n{physician}:")
-            for task in tasks:
+            for task in assignments.view(self._base_ord):
                 print(f"  {task['task'].name}: {task['start_date']} - {task['end_date']} (Score: {task['score']:.2f})")
 
     def check_conflicts(self):
         conflicts = []
-        for physician, tasks in self.schedule.items():
-            sorted_tasks = sorted(tasks, key=lambda x: x['start_date'])
-            for i in range(len(sorted_tasks) - 1):
-                if sorted_tasks[i]['end_date'] >= sorted_tasks[i + 1]['start_date']:
-                    conflicts.append(
-                        f"Conflict for {physician}: {sorted_tasks[i]['task'].name} and {sorted_tasks[i + 1]['task'].name} overlap")
+        for physician, assignments in self.schedule.items():
+            spans = sorted(zip(assignments.start_ords, assignments.end_ords, (t.name for t in assignments.tasks)),
+                           key=itemgetter(0))
+            for (_, end, name), (start, _, next_name) in zip(spans, spans[1:]):
+                if end >= start:
+                    conflicts.append(f"Conflict for {physician}: {name} and {next_name} overlap")
         return conflicts
 
     def save_schedule(self, filename):
         serializable_schedule = {
-            physician: [
-                {**task, 'task': task['task'].name}
-                for task in tasks
-            ]
-            for physician, tasks in self.schedule.items()
+            physician: assignments.to_dict(self._base_ord)
+            for physician, assignments in self.schedule.items()
         }
         with open(filename, 'w') as f:
-            json.dump(serializable_schedule, f, indent=2, default=str)
+            json.dump(serializable_schedule, f, indent=2)
 
     def load_schedule(self, filename):
         with open(filename, 'r') as f:
             loaded_schedule = json.load(f)
-        self.schedule = defaultdict(list, {
-            k: [
-                {
-                    **t,
-                    'start_date': date.fromisoformat(t['start_date']),
-                    'end_date': date.fromisoformat(t['end_date']),
-                    'task': self.task_manager.get_task(t['task'])
-                }
-                for t in v
-            ]
-            for k, v in loaded_schedule.items()
-        })
+        self.schedule = defaultdict(PhysicianSchedule)
+        self._phys_day_mask = defaultdict(int)
+        self._task_day_mask = defaultdict(int)
+        for physician, tasks in loaded_schedule.items():
+            for t in tasks:
+                task = self.task_manager.get_task(t['task'])
+                if task is None:
+                    raise ValueError(f"Unknown task '{t['task']}' in schedule entry for {physician}: {t}")
+                days = [date.fromisoformat(day) for day in t['days']]
+                if not days:
+                    raise ValueError(f"Schedule entry for {physician} has no days: {t}")
+                if min(days).toordinal() < self._base_ord:
+                    raise ValueError(f"Schedule entry for {physician} starts before the calendar start "
+                                     f"{self.calendar.start_date}: {t}")
+                period = self._prepare_period({'days': days})
+                self._add_to_schedule(physician, task, period, t['score'])
 
     def get_statistics(self):
         stats = {}
-        for physician, tasks in self.schedule.items():
-            physician_stats = defaultdict(int)
-            total_days = 0
-            for task in tasks:
-                physician_stats[task['task'].name] += 1
-                total_days += (task['end_date'] - task['start_date']).days + 1
+        physicians_by_name = {p.name: p for p in self.physician_manager.data['physicians']}
+        for physician, assignments in self.schedule.items():
+            physician_stats = Counter(task.name for task in assignments.tasks)
+            total_days = sum(assignments.end_ords) - sum(assignments.start_ords) + len(assignments)
 
             working_weeks = total_days / 7
-            physician_obj = self.physician_manager.get_physician_by_name(physician)
+            physician_obj = physicians_by_name.get(physician)
             desired_weeks_met = working_weeks >= physician_obj.desired_working_weeks * 52
 
             stats[physician] = {
@@ -410,19 +587,29 @@ class Schedule:
 
     def get_unassigned_tasks(self):
         all_tasks = set(task.name for task in self.task_manager.data['tasks'])
-        assigned_tasks = set(task['task'].name for tasks in self.schedule.values() for task in tasks)
+        assigned_tasks = set(task.name for assignments in self.schedule.values() for task in assignments.tasks)
         return all_tasks - assigned_tasks
 
     def generate_ics_calendar(self, filename):
-        cal = IcsCalendar()
-        for physician, tasks in self.schedule.items():
-            for task in tasks:
-                event = Event()
-                event.name = f"{task['task'].name} - {physician}"
-                event.begin = task['start_date'].isoformat()
-                event.end = (task['end_date'] + timedelta(days=1)).isoformat()  # End date should be exclusive
-                event.description = f"Task: {task['task'].name}\nPhysician: {physician}\nScore: {task['score']}"
-                cal.events.add(event)
-
-        with open(filename, 'w') as f:
-            f.writelines(cal)
\ No newline at end of file
+        with open(filename, 'w', newline='') as f:
+            f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Dr-Scheduler//EN\r\n")
+            for physician, assignments in self.schedule.items():
+                for task, start_ord, end_ord, score in zip(assignments.tasks, assignments.start_ords,
+                                                           assignments.end_ords, assignments.scores):
+                    uid = str(uuid.uuid4())
+                    description = self._escape_ics_text(f"Task: {task.name}\nPhysician: {physician}\nScore: {score}")
+                    f.write(f"BEGIN:VEVENT\r\n"
+                            f"DESCRIPTION:{description}\r\n"
+                            f"DTEND:{date.fromordinal(end_ord + 1):%Y%m%d}T000000Z\r\n"  # End date should be exclusive
+                            f"DTSTART:{date.fromordinal(start_ord):%Y%m%d}T000000Z\r\n"
+                            f"SUMMARY:{self._escape_ics_text(f'{task.name} - {physician}')}\r\n"
+                            f"UID:{uid}@{uid[:4]}.org\r\n"
+                            f"END:VEVENT\r\n")
+            f.write("END:VCALENDAR\r\n")
+
+    @staticmethod
+    def _escape_ics_text(text: str) -> str:
+        """
+        Escapes a TEXT property value as required by RFC 5545.
+        """
+        return text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
@@ -2,12 +2,12 @@
 # This will eventually be fetched via API
 
 import json
-from datetime import date, datetime
+from datetime import date
 from typing import Dict, List, Union, Tuple
 
 
 def parse_date(date_str: str) -> date:
-    return datetime.strptime(date_str, "%Y-%m-%d").date()
+    return date.fromisoformat(date_str)
 
 def load_unavailability_periods(filename: str) -> Dict[str, List[Union[date, Tuple[date, date]]]]:
     with open(filename, 'r') as f: